@@ -12,11 +12,12 @@ __created_at__ = "Tue Apr 17 22:20:39 2018"
 ###############################################################################
 
 import re
+import sys
 import logging
 
 from collections import defaultdict
-from itertools import product
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator, List, Pattern, Tuple
 
 ###############################################################################
 
@@ -38,7 +39,7 @@ def ord_unicode(ch: str) -> str:
     str
         4-character unicode identifier
     """
-    return hex(ord(ch)).split("x")[1].zfill(4)
+    return f"{ord(ch):04x}"
 
 
 def chr_unicode(u: str) -> str:
@@ -178,6 +179,17 @@ COMBINING_DIGIT_MARKS = ["꣠", "꣡", "꣢", "꣣", "꣤", "꣥", "꣦", "꣧",
 KSHA = "क्ष"
 JNA = "ज्ञ"
 
+# --------------------------------------------------------------------------- #
+# Sets (for membership tests)
+
+_ALL_SWARA_SET = frozenset(ALL_SWARA)
+_ALL_VYANJANA_SET = frozenset(ALL_VYANJANA)
+_ALL_MATRA_SET = frozenset(ALL_MATRA)
+_AYOGAVAAHA_COMMON_SET = frozenset(AYOGAVAAHA_COMMON)
+_MATRA_LIKE_SET = frozenset(ARTIFICIAL_MATRA + ALL_MATRA)
+
+_LAGHU_SET = frozenset(ALL_VYANJANA + LAGHU_SWARA + LAGHU_MATRA + [HALANTA])
+
 ###############################################################################
 
 
@@ -229,6 +241,20 @@ MAAHESHWARA_SUTRA = [
 
 MAAHESHWARA_KRAMA = [varna for sutra in MAAHESHWARA_SUTRA for varna in sutra]
 
+_KRAMA_POSITIONS = defaultdict(list)
+for _krama_idx, _varna in enumerate(MAAHESHWARA_KRAMA):
+    _KRAMA_POSITIONS[_varna].append(_krama_idx)
+_KRAMA_POSITIONS = dict(_KRAMA_POSITIONS)
+
+# varna without the it-markers, and the number of such varna before each
+# position of MAAHESHWARA_KRAMA (so that a range can be resolved by a slice)
+_KRAMA_NON_HALANTA = [v for v in MAAHESHWARA_KRAMA if HALANTA not in v]
+_KRAMA_NON_HALANTA_BEFORE = [0]
+for _varna in MAAHESHWARA_KRAMA:
+    _KRAMA_NON_HALANTA_BEFORE.append(
+        _KRAMA_NON_HALANTA_BEFORE[-1] + (HALANTA not in _varna)
+    )
+
 # --------------------------------------------------------------------------- #
 
 MAAHESHWARA_IDX = defaultdict(list)
@@ -243,75 +269,112 @@ for _sutra_idx, sutra in enumerate(MAAHESHWARA_SUTRA):
             idx += 1
         MAAHESHWARA_IDX[varna].append((_sutra_idx, _internal_idx, _idx))
 
+# read-only after construction
+MAAHESHWARA_IDX = {k: tuple(v) for k, v in MAAHESHWARA_IDX.items()}
+
 ###############################################################################
 
 
 def form_pratyaahaara(letters: List[str]) -> str:
     """Form a pratyaahaara from a list of letters"""
-    varna_idx = []
+    varna_list = []
     ignored = []
 
     for varna in letters:
         if varna in MAAHESHWARA_IDX and HALANTA not in varna:
-            varna_idx.append(MAAHESHWARA_IDX[varna])
+            varna_list.append(varna)
         else:
             ignored.append(varna)
 
     if ignored:
         LOGGER.info(f"Ignored letters: {ignored}")
 
-    varna_idxs = product(*varna_idx)
-    for v_idx in varna_idxs:
-        v_idx = sorted(v_idx, key=lambda x: x[2])
-        _v_idx = [w[2] for w in v_idx]
-        if _v_idx != list(range(_v_idx[0], _v_idx[-1] + 1)):
-            continue
-        else:
+    # letters must form a contiguous window in the krama (without it-markers)
+    # such a window has to start at one of the positions of the letters
+    num_varna = len(varna_list)
+    sorted_varna_list = sorted(varna_list)
+    window_starts = sorted(
+        {idx[2] for varna in varna_list for idx in MAAHESHWARA_IDX[varna]}
+    )
+    for window_start in window_starts:
+        window_end = window_start + num_varna
+        window = _KRAMA_NON_HALANTA[window_start:window_end]
+        if sorted(window) == sorted_varna_list:
             break
     else:
         LOGGER.warning("Cannot form a pratyaahara due to discontinuity.")
         return None
 
-    _aadi_idx = v_idx[0]
-    _pre_antya_idx = v_idx[-1]
+    _pre_antya_idx = next(
+        idx
+        for idx in MAAHESHWARA_IDX[window[-1]]
+        if idx[2] == window_end - 1
+    )
 
     if _pre_antya_idx[1] != len(MAAHESHWARA_SUTRA[_pre_antya_idx[0]]) - 2:
         LOGGER.warning("Cannot form a pratyaahara due to end position.")
         return None
 
-    aadi = MAAHESHWARA_SUTRA[_aadi_idx[0]][_aadi_idx[1]]
+    aadi = window[0]
     antya = MAAHESHWARA_SUTRA[_pre_antya_idx[0]][-1]
     return f"{aadi}{antya}"
 
 
-def resolve_pratyaahaara(pratyaahaara: str) -> List[List[str]]:
-    """Resolve pratyaahaara into all possible lists of characters"""
+@lru_cache(maxsize=128)
+def _resolve_pratyaahaara(pratyaahaara: str) -> Tuple[Tuple[str, ...], ...]:
+    """Resolve pratyaahaara (cached, immutable result)"""
     aadi = pratyaahaara[0]
     antya = pratyaahaara[1:]
 
-    possible_starts = []
-    possible_ends = []
-
-    for idx, varna in enumerate(MAAHESHWARA_KRAMA):
-        if varna == aadi:
-            possible_starts.append(idx)
-        if varna == antya:
-            possible_ends.append(idx)
+    possible_starts = _KRAMA_POSITIONS.get(aadi, [])
+    possible_ends = _KRAMA_POSITIONS.get(antya, [])
 
-    resolutions = [
-        [
-            MAAHESHWARA_KRAMA[idx]
-            for idx in range(start, end)
-            if HALANTA not in MAAHESHWARA_KRAMA[idx]
-        ]
+    resolutions = tuple(
+        tuple(
+            _KRAMA_NON_HALANTA[
+                _KRAMA_NON_HALANTA_BEFORE[start]:_KRAMA_NON_HALANTA_BEFORE[end]
+            ]
+        )
         for start in possible_starts
         for end in possible_ends
         if start < end
-    ]
+    )
     return resolutions
 
+
+def resolve_pratyaahaara(pratyaahaara: str) -> List[List[str]]:
+    """Resolve pratyaahaara into all possible lists of characters"""
+    return [list(r) for r in _resolve_pratyaahaara(pratyaahaara)]
+
+
 ###############################################################################
 
+_ALPHABET_SET = frozenset(ALPHABET)
+_SPACES_SET = frozenset(SPACES)
+_PUNCTUATION_SET = frozenset(PUNCTUATION + GENERAL_PUNCTUATION)
+_DIGITS_SET = frozenset(DIGITS)
+
+_ALPHABET_RE = re.compile(f"[{re.escape(''.join(sorted(_ALPHABET_SET)))}]")
+
+
+@lru_cache(maxsize=128)
+def _build_clean_pattern(
+    spaces: bool, punct: bool, digits: bool, allow: frozenset
+) -> Pattern:
+    """Build (and cache) the regular expression used by `clean`
+
+    The pattern matches runs of characters that are not allowed.
+    """
+    alphabet = _ALPHABET_SET | allow
+    if spaces:
+        alphabet |= _SPACES_SET
+    if punct:
+        alphabet |= _PUNCTUATION_SET
+    if digits:
+        alphabet |= _DIGITS_SET
+    allowed = "".join(sorted(c for c in alphabet if len(c) == 1))
+    return re.compile(f"[^{re.escape(allowed)}]+")
+
 
 def clean(
     text: str,
@@ -346,50 +409,90 @@ def clean(
     str
         Clean version of the string
     """
-    allow = allow or []
-    alphabet = ALPHABET + allow
-    if spaces:
-        alphabet += SPACES
-    if punct:
-        alphabet += PUNCTUATION + GENERAL_PUNCTUATION
-    if digits:
-        alphabet += DIGITS
-    answer = "".join(["" if c not in alphabet else c for c in text])
+    pattern = _build_clean_pattern(
+        bool(spaces), bool(punct), bool(digits), frozenset(allow or [])
+    )
+    answer = pattern.sub("", text)
     answer = "\n".join(
         [" ".join(line.split()) for line in answer.split("\n") if line.strip()]
     )
     return answer
 
 
-def split_lines(text: str, pattern=r"[।॥\r\n]+") -> List[str]:
+def _clean_words(words: List[str]) -> List[str]:
+    """Clean a list of words (without whitespace) in a single pass
+
+    Equivalent to `[clean(word, spaces=False) for word in words]`
+    """
+    if not words:
+        return []
+    pattern = _build_clean_pattern(True, False, False, frozenset())
+    return pattern.sub("", "\n".join(words)).split("\n")
+
+
+_LINE_SEPARATORS = ("।", "॥", "\r", "\n")
+_LINE_SPLIT_RE = re.compile(f"[{re.escape(''.join(_LINE_SEPARATORS))}]+")
+
+
+def split_lines(text: str, pattern=_LINE_SPLIT_RE) -> List[str]:
     """Split a string into a list of strings using regular expression
 
     Parameters
     ----------
     text : str
         Input string
-    pattern : regexp, optional
+    pattern : str or Pattern, optional
         Regular expression corresponding to the split points.
-        The default is r'[।॥\\r\\n]+'.
+        The default is r'[।॥\\r\\n]+' (precompiled).
 
     Returns
     -------
     List[str]
         List of strings
     """
-    return list(filter(None, re.split(pattern, text)))
+    if pattern is _LINE_SPLIT_RE:
+        return _split_lines(text)
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    return [s for s in pattern.split(text) if s]
+
+
+def _split_lines(text: str) -> List[str]:
+    """Split a string on danda, double danda and line breaks
+
+    Equivalent to `split_lines` with the default pattern, but maps every
+    separator in `_LINE_SEPARATORS` to a newline with `str.replace` and
+    splits once, which is considerably faster than the regular expression
+    split.
+    """
+    for separator in _LINE_SEPARATORS:
+        if separator != "\n":
+            text = text.replace(separator, "\n")
+    return [s for s in text.split("\n") if s]
+
+
+def _iter_lines_words(text: str) -> Iterator[List[str]]:
+    """Iterate over lines of a text, yielding the list of words in each line
+
+    Lines are obtained using `_split_lines` (after stripping the text) and
+    words are separated by whitespace.
+    """
+    for line in _split_lines(text.strip()):
+        yield line.split()
 
 
 ###############################################################################
 
+_TRIM_TAIL = frozenset([ANUSWARA, HALANTA, VISARGA])
+
 
 def trim_matra(line: str) -> str:
     """Trim matra from the end of a string"""
     # TODO: If there is no general utility, consider removing this function.
-    answer = line
-    if line[-1] in [ANUSWARA, HALANTA, VISARGA]:
-        answer = line[:-1]
-    if answer[-1] in ALL_MATRA:
+    if not line:
+        return line
+    answer = line[:-1] if line[-1] in _TRIM_TAIL else line
+    if answer and answer[-1] in _ALL_MATRA_SET:
         answer = answer[:-1]
     return answer
 
@@ -400,17 +503,7 @@ def trim_matra(line: str) -> str:
 def is_laghu(syllable: str) -> bool:
     """Checks if the current syllable is Laghu"""
 
-    return all(
-        [
-            (
-                x in ALL_VYANJANA
-                or x in LAGHU_SWARA
-                or x in LAGHU_MATRA
-                or x == HALANTA
-            )
-            for x in syllable
-        ]
-    )
+    return all(x in _LAGHU_SET for x in syllable)
 
 
 def toggle_matra(syllable: str) -> str:
@@ -432,74 +525,79 @@ def toggle_matra(syllable: str) -> str:
 
 ###############################################################################
 
+_MATRA_TO_SWARA = {m: m[1:] for m in ARTIFICIAL_MATRA}
+_MATRA_TO_SWARA.update({m: SWARA[idx + 1] for idx, m in enumerate(MATRA)})
+_MATRA_TO_SWARA.update(
+    {m: EXTENDED_SWARA[idx] for idx, m in enumerate(EXTENDED_MATRA)}
+)
+
+_SWARA_TO_MATRA = {v: k for k, v in _MATRA_TO_SWARA.items()}
+
 
 def marker_to_swara(m: str) -> str:
     """Convert a Matra to corresponding Swara"""
-    if m in ARTIFICIAL_MATRA:
-        return m[1:]
-
-    if m in MATRA:
-        m_idx = MATRA.index(m)
-        return SWARA[m_idx + 1]
-    elif m in EXTENDED_MATRA:
-        m_idx = EXTENDED_MATRA.index(m)
-        return EXTENDED_SWARA[m]
-    return None
+    return _MATRA_TO_SWARA.get(m)
 
 
 def swara_to_marker(s: str) -> str:
     """Convert a Swara to correponding Matra"""
-    if s == SWARA[0]:
-        return f"-{s}"
-
-    if s in SWARA:
-        s_idx = SWARA.index(s)
-        return MATRA[s_idx - 1]
-    if s in EXTENDED_SWARA[:-1]:
-        s_idx = EXTENDED_SWARA.index(s)
-        return EXTENDED_MATRA[s_idx]
-    return None
+    return _SWARA_TO_MATRA.get(s)
 
 
 ###############################################################################
 
+_ANUNAASIKA = {
+    ch: VYANJANA[(idx // 5) * 5 + 4] if idx < 25 else ANUSWARA
+    for idx, ch in enumerate(VYANJANA)
+}
+_ANUNAASIKA[""] = AUSHTHYA[4]
+
+_ANUSWARA_RE = re.compile(f"{ANUSWARA}(?=[{''.join(VARGIYA)}])")
+_ANUSWARA_REPLACEMENT = {ch: _ANUNAASIKA[ch] + HALANTA for ch in VARGIYA}
+
 
 def get_anunaasika(ch: str) -> str:
     """Get the appropriate anunaasika from the character's group"""
-    MA = AUSHTHYA[4]
-    if ch == "":
-        return MA
-    if ch in VYANJANA:
-        i = VYANJANA.index(ch)
-        if i < 25:
-            return VYANJANA[int(i / 5) * 5 + 4]
-        else:
-            return ANUSWARA
-    else:
-        return ANUSWARA
+    return _ANUNAASIKA.get(ch, ANUSWARA)
 
 
 def fix_anuswara(text: str) -> str:
     """
     Check every anuswaara in the text and change to anunaasika if applicable
     """
-    output_chars = []
-    if text:
-        for idx in range(len(text) - 1):
-            char = text[idx]
-            next_char = text[idx + 1]
-            if char == ANUSWARA and next_char in VARGIYA:
-                anunasika = get_anunaasika(next_char)
-                output_chars.append(anunasika)
-                output_chars.append(HALANTA)
-            else:
-                output_chars.append(char)
-        output_chars.append(text[-1])
-    return "".join(output_chars)
+    return _ANUSWARA_RE.sub(
+        lambda m: _ANUSWARA_REPLACEMENT[m.string[m.end()]], text
+    )
 
 
 ###############################################################################
 
+_START_CHARS = frozenset(VARNA + SPECIAL)
+_START_CHARS_TECHNICAL = _START_CHARS | frozenset(AYOGAVAAHA_COMMON)
+
+
+def _build_syllable_pattern(
+    start_chars: frozenset, technical: bool
+) -> Pattern:
+    """Build the regular expression that matches a single syllable
+
+    A segment is any character followed by characters which are not in
+    `start_chars` (words split to start at START_CHARS).
+    Unless `technical` is True, a segment ending with HALANTA is merged with
+    the following segment.
+    """
+    start = re.escape("".join(sorted(start_chars)))
+    segment = f".[^{start}]*"
+    if technical:
+        return re.compile(segment, re.DOTALL)
+    return re.compile(
+        f"(?:{segment}(?<={HALANTA})(?=[{start}]))*{segment}", re.DOTALL
+    )
+
+
+_SYLLABLE_RE = _build_syllable_pattern(_START_CHARS, False)
+_SYLLABLE_TECHNICAL_RE = _build_syllable_pattern(_START_CHARS_TECHNICAL, True)
+
 
 def get_syllables_word(word: str, technical: bool = False) -> List[str]:
     """Get syllables from a Sanskrit (Devanagari) word
@@ -520,26 +618,15 @@ def get_syllables_word(word: str, technical: bool = False) -> List[str]:
         List of syllables
     """
     word = clean(word, spaces=False)
-    wlen = len(word)
-    word_syllables = []
+    return list(_get_syllables_clean_word(word, bool(technical)))
 
-    current = ""
-    i = 0
-    while i < wlen:
-        curr_ch = word[i]
-        current += curr_ch
-        i += 1
-        # words split to start at START_CHARS
-        start_chars = VARNA + SPECIAL
-        if technical:
-            start_chars += AYOGAVAAHA_COMMON
-        while i < wlen and word[i] not in start_chars:
-            current += word[i]
-            i += 1
-        if current[-1] != HALANTA or i == wlen or technical:
-            word_syllables.append(current)
-            current = ""
-    return word_syllables
+
+@lru_cache(maxsize=4096)
+def _get_syllables_clean_word(word: str, technical: bool) -> Tuple[str, ...]:
+    """Get syllables from a word that has already been cleaned (cached)"""
+    if technical:
+        return tuple(_SYLLABLE_TECHNICAL_RE.findall(word))
+    return tuple(_SYLLABLE_RE.findall(word))
 
 
 def get_syllables(text: str, technical: bool = False) -> List[List[List[str]]]:
@@ -560,14 +647,19 @@ def get_syllables(text: str, technical: bool = False) -> List[List[List[str]]]:
         List of syllables in a nested list format
         Nesting Levels: Text -> Lines -> Words
     """
-    lines = split_lines(text.strip())
+    if not _ALPHABET_RE.search(text):
+        # no Sanskrit characters, every word would be cleaned to nothing
+        return [
+            [[] for _word in words] for words in _iter_lines_words(text)
+        ]
+
     syllables = []
-    for line in lines:
-        words = line.split()
+    for words in _iter_lines_words(text):
+        words = _clean_words(words)
         line_syllables = []
         for word in words:
-            word_syllables = get_syllables_word(word, technical)
-            line_syllables.append(word_syllables)
+            word_syllables = _get_syllables_clean_word(word, bool(technical))
+            line_syllables.append(list(word_syllables))
         syllables.append(line_syllables)
     return syllables
 
@@ -592,44 +684,76 @@ def split_varna_word(word: str, technical: bool = True) -> List[str]:
     List[str]
         List of Varna
     """
-    word_syllables = get_syllables_word(word, True)
+    word_viccheda, warnings = _split_varna_word(word, bool(technical))
+    # logged here (not in the cached helpers) so that every call reports
+    for warning in warnings:
+        LOGGER.warning(warning)
+    return list(word_viccheda)
+
+
+@lru_cache(maxsize=4096)
+def _split_varna_syllable(syllable: str) -> Tuple[Tuple[str, ...], str]:
+    """Obtain the (technical) Varna decomposition of a syllable (cached)
+
+    Returns the decomposition along with a warning message (empty if none).
+    """
+    syllable_viccheda = []
+    warning = ""
+    if syllable[0] in _ALL_SWARA_SET:
+        syllable_viccheda.append(syllable[0])
+        if len(syllable) > 1:
+            syllable_viccheda.append(syllable[1])
+        # TODO: Will this ever be the case?
+        if len(syllable) > 2:
+            warning = f"Long SWARA: {syllable}"
+            syllable_viccheda.append(syllable[2:])
+    elif syllable[0] in _ALL_VYANJANA_SET:
+        syllable_viccheda.append(syllable[0] + HALANTA)
+        if len(syllable) == 1:
+            syllable_viccheda.append(ARTIFICIAL_MATRA_A)
+        if len(syllable) > 1:
+            if syllable[1] in _AYOGAVAAHA_COMMON_SET:
+                syllable_viccheda.append(ARTIFICIAL_MATRA_A)
+            if syllable[1] != HALANTA:
+                syllable_viccheda.append(syllable[1])
+        # TODO: Will this ever be the case?
+        if len(syllable) > 2:
+            warning = f"Long VYANJANA: {syllable}"
+            syllable_viccheda.append(syllable[2:])
+    else:
+        syllable_viccheda.append(syllable)
+    return tuple(syllable_viccheda), warning
+
+
+@lru_cache(maxsize=4096)
+def _split_varna_word(
+    word: str, technical: bool
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Obtain the Varna decomposition of a word (cached)
+
+    Returns the decomposition along with the warning messages to be logged.
+    """
+    word_syllables = _get_syllables_clean_word(clean(word, spaces=False), True)
     word_viccheda = []
+    warnings = []
     for syllable in word_syllables:
-        if syllable[0] in ALL_SWARA:
-            word_viccheda.append(syllable[0])
-            if len(syllable) > 1:
-                word_viccheda.append(syllable[1])
-            # TODO: Will this ever be the case?
-            if len(syllable) > 2:
-                LOGGER.warning(f"Long SWARA: {syllable}")
-                word_viccheda.append(syllable[2:])
-        elif syllable[0] in ALL_VYANJANA:
-            word_viccheda.append(syllable[0] + HALANTA)
-            if len(syllable) == 1:
-                word_viccheda.append(ARTIFICIAL_MATRA_A)
-            if len(syllable) > 1:
-                if syllable[1] in AYOGAVAAHA_COMMON:
-                    word_viccheda.append(ARTIFICIAL_MATRA_A)
-                if syllable[1] != HALANTA:
-                    word_viccheda.append(syllable[1])
-            # TODO: Will this ever be the case?
-            if len(syllable) > 2:
-                LOGGER.warning(f"Long VYANJANA: {syllable}")
-                word_viccheda.append(syllable[2:])
-        else:
-            word_viccheda.append(syllable)
+        syllable_viccheda, warning = _split_varna_syllable(syllable)
+        word_viccheda.extend(syllable_viccheda)
+        if warning:
+            warnings.append(warning)
 
     if not technical:
+        # ayogavaaha is attached to the preceding varna
         real_word_viccheda = []
         for varna in word_viccheda:
-            if varna in ARTIFICIAL_MATRA + ALL_MATRA:
-                real_word_viccheda.append(marker_to_swara(varna))
-            elif varna in AYOGAVAAHA_COMMON:
-                real_word_viccheda[-1] += varna
+            if varna in _MATRA_LIKE_SET:
+                real_word_viccheda.append([marker_to_swara(varna)])
+            elif varna in _AYOGAVAAHA_COMMON_SET:
+                real_word_viccheda[-1].append(varna)
             else:
-                real_word_viccheda.append(varna)
-        word_viccheda = real_word_viccheda
-    return word_viccheda
+                real_word_viccheda.append([varna])
+        word_viccheda = ["".join(parts) for parts in real_word_viccheda]
+    return tuple(word_viccheda), tuple(warnings)
 
 
 def split_varna(
@@ -666,15 +790,20 @@ def split_varna(
         separated by a space character ' '.
     """
 
-    lines = split_lines(text.strip())
+    lines = list(_iter_lines_words(text))
+    # without any Sanskrit characters, every word splits into nothing
+    is_sanskrit = _ALPHABET_RE.search(text) is not None
+
     viccheda = []
     num_lines = len(lines)
-    for line_idx, line in enumerate(lines):
-        words = line.split()
+    for line_idx, words in enumerate(lines):
         line_viccheda = []
         num_words = len(words)
         for word_idx, word in enumerate(words):
-            word_viccheda = split_varna_word(word, technical)
+            if is_sanskrit:
+                word_viccheda = split_varna_word(word, technical)
+            else:
+                word_viccheda = []
             if flat:
                 line_viccheda.extend(word_viccheda)
                 if word_idx != num_words - 1:
@@ -728,9 +857,9 @@ def join_varna(viccheda: str, technical: bool = True) -> str:
             word.append(curr_varna)
             continue
 
-        if curr_varna[0] in ALL_SWARA + SPECIAL:
+        if curr_varna[0] in _ALL_SWARA_SET or curr_varna[0] in SPECIAL:
             word.append(curr_varna[0])
-            if curr_varna[-1] in AYOGAVAAHA_COMMON:
+            if curr_varna[-1] in _AYOGAVAAHA_COMMON_SET:
                 word.append(curr_varna[-1])
         if curr_varna[-1] == HALANTA:
             if next_varna in [" ", "\n"]:
@@ -741,7 +870,7 @@ def join_varna(viccheda: str, technical: bool = True) -> str:
                 break
             if next_varna[-1] == HALANTA:
                 word.append(curr_varna)
-            if next_varna[0] in ALL_SWARA:
+            if next_varna[0] in _ALL_SWARA_SET:
                 i += 1
                 word.append(curr_varna[:-1])
                 if next_varna[0] != SWARA[0]:
@@ -753,15 +882,18 @@ def join_varna(viccheda: str, technical: bool = True) -> str:
                         f"Next Varna is SWARA + VISARGA: {next_varna}"
                     )
                     word.append(next_varna[-1])
-            if next_varna in AYOGAVAAHA_COMMON:
+            if next_varna in _AYOGAVAAHA_COMMON_SET:
                 i += 1
                 word.append(curr_varna[:-1] + next_varna)
-            if next_varna in ARTIFICIAL_MATRA + ALL_MATRA:
+            if next_varna in _MATRA_LIKE_SET:
                 i += 1
                 word.append(curr_varna[:-1])
                 if next_varna != ARTIFICIAL_MATRA_A:
                     word.append(next_varna)
-        if curr_varna in ARTIFICIAL_MATRA + ALL_MATRA + AYOGAVAAHA_COMMON:
+        if (
+            curr_varna in _MATRA_LIKE_SET
+            or curr_varna in _AYOGAVAAHA_COMMON_SET
+        ):
             word.append(curr_varna)
 
     return "".join(word)
@@ -819,22 +951,22 @@ AABHYANTARA_NAMES = {
 
 ###############################################################################
 
+_KHAR = tuple(resolve_pratyaahaara("खर्")[0])
+_HASH = tuple(resolve_pratyaahaara("हश्")[0])
+_YAN = tuple(resolve_pratyaahaara("यण्")[0])
+_SHAL = tuple(resolve_pratyaahaara("शल्")[0])
+
 BAAHYA = {
-    "B_VVR": resolve_pratyaahaara("खर्")[0],
-    "B_SVR": resolve_pratyaahaara("हश्")[0] + SWARA,
-    "B_SW": resolve_pratyaahaara("खर्")[0],
-    "B_ND": resolve_pratyaahaara("हश्")[0] + SWARA,
-    "B_GH": resolve_pratyaahaara("हश्")[0] + SWARA,
-    "B_AGH": resolve_pratyaahaara("खर्")[0],
-    "B_AP": (
-        VARGA_PRATHAMA
-        + VARGA_TRITIYA
-        + VARGA_PANCHAMA
-        + resolve_pratyaahaara("यण्")[0]
-    )
+    "B_VVR": list(_KHAR),
+    "B_SVR": list(_HASH) + SWARA,
+    "B_SW": list(_KHAR),
+    "B_ND": list(_HASH) + SWARA,
+    "B_GH": list(_HASH) + SWARA,
+    "B_AGH": list(_KHAR),
+    "B_AP": (VARGA_PRATHAMA + VARGA_TRITIYA + VARGA_PANCHAMA + list(_YAN))
     + SWARA
     + [CHANDRABINDU, ANUSWARA],
-    "B_MP": (VARGA_DWITIYA + VARGA_CHATURTHA + resolve_pratyaahaara("शल्")[0])
+    "B_MP": (VARGA_DWITIYA + VARGA_CHATURTHA + list(_SHAL))
     + [VISARGA, JIHVAAMULIYA, UPADHMANIYA],
     "B_U": SWARA,
     "B_ANU": [s + ANUDATTA for s in SWARA],
@@ -860,9 +992,100 @@ BAAHYA_NAMES = {
 UCCHAARANA = dict(**STHAANA, **AABHYANTARA, **BAAHYA)
 UCCHAARANA_NAMES = dict(**STHAANA_NAMES, **AABHYANTARA_NAMES, **BAAHYA_NAMES)
 
+# --------------------------------------------------------------------------- #
+# Inverse Index: varna -> keys (one per dimension)
+
+_UCCHAARANA_INVERSE = []
+for _dimension in [STHAANA, AABHYANTARA, BAAHYA]:
+    _inverse = defaultdict(list)
+    for _key, _varna_list in _dimension.items():
+        for _varna in set(_varna_list):
+            _inverse[_varna].append(_key)
+    _UCCHAARANA_INVERSE.append(dict(_inverse))
+
+# --------------------------------------------------------------------------- #
+# Lookup Table: (dimension, abbrev) -> varna -> ucchaarana
+
+_UCCHAARANA_TABLE = {}
+for _dimension, _names in enumerate(
+    [STHAANA_NAMES, AABHYANTARA_NAMES, BAAHYA_NAMES]
+):
+    for _abbrev in [False, True]:
+        _table = {}
+        for _varna, _keys in _UCCHAARANA_INVERSE[_dimension].items():
+            if _abbrev:
+                _ucchaarana = "-".join(_keys)
+            else:
+                _ucchaarana = [_names[_key] for _key in _keys]
+                if len(_ucchaarana) > 1:
+                    _ucchaarana.append("च")
+                _ucchaarana = " ".join(_ucchaarana)
+            # identical strings share a single object across varnas
+            _table[_varna] = sys.intern(_ucchaarana)
+        _UCCHAARANA_TABLE[(_dimension, _abbrev)] = _table
+
+# --------------------------------------------------------------------------- #
+# Signature Table: abbrev -> varna -> (sthaana, aabhyantara, baahya)
+
+_SIGNATURE_TABLE = {}
+for _abbrev in [False, True]:
+    _SIGNATURE_TABLE[_abbrev] = {
+        _varna: tuple(
+            _UCCHAARANA_TABLE[(_dimension, _abbrev)].get(_varna, "")
+            for _dimension in range(3)
+        )
+        for _varna in set().union(*_UCCHAARANA_INVERSE)
+    }
+_EMPTY_SIGNATURE = ("", "", "")
+
+# --------------------------------------------------------------------------- #
+# Vectors: varna -> keys (all dimensions), zero-vector templates
+
+_LETTER_TO_CATEGORIES = {}
+for _inverse in _UCCHAARANA_INVERSE:
+    for _varna, _keys in _inverse.items():
+        _LETTER_TO_CATEGORIES[_varna] = _LETTER_TO_CATEGORIES.get(
+            _varna, ()
+        ) + tuple(_keys)
+
+_ZERO_VECTOR = {True: {}, False: {}}
+for _key in UCCHAARANA:
+    _ZERO_VECTOR[True][_key] = 0
+    _ZERO_VECTOR[False][UCCHAARANA_NAMES[_key]] = 0
+
+# --------------------------------------------------------------------------- #
+# Bitmasks: category key -> bit position, varna -> OR of category bits
+
+_UCCHAARANA_INDEX = {_key: _idx for _idx, _key in enumerate(UCCHAARANA)}
+
+_LETTER_BITMASK = {}
+for _varna, _keys in _LETTER_TO_CATEGORIES.items():
+    _bits = 0
+    for _key in _keys:
+        _bits |= 1 << _UCCHAARANA_INDEX[_key]
+    _LETTER_BITMASK[_varna] = _bits
+
 ###############################################################################
 
 
+def _iter_letters(word: str) -> Iterator[str]:
+    """Iterate over letters of a word for ucchaarana analysis
+
+    Varna decomposition of the word with `technical=False`, where a swara
+    carrying an ayogavaaha is yielded as separate characters.
+    """
+    for letter in split_varna_word(word, technical=False):
+        if not _AYOGAVAAHA_COMMON_SET.isdisjoint(letter):
+            yield from letter
+        else:
+            yield letter
+
+
+def _strip_halanta(letter: str) -> str:
+    """Remove the trailing halanta (if any) of a letter to obtain the varna"""
+    return letter[:-1] if letter.endswith(HALANTA) else letter
+
+
 def get_ucchaarana_vector(letter: str, abbrev=False) -> Dict[str, int]:
     """
     Get ucchaarana sthaana and prayatna based vector of a letter
@@ -882,23 +1105,42 @@ def get_ucchaarana_vector(letter: str, abbrev=False) -> Dict[str, int]:
         One-hot vector indicating utpatti sthaana, aabhyantara prayatna and
         baahya prayatna of a letter
     """
-    varna = letter.replace(HALANTA, "") if letter.endswith(HALANTA) else letter
-    if abbrev:
+    varna = _strip_halanta(letter)
+    return dict(_get_ucchaarana_vector(varna, bool(abbrev)))
 
-        def ucchaarana_name(s):
-            return s
 
-    else:
+@lru_cache(maxsize=1024)
+def _get_ucchaarana_vector(
+    varna: str, abbrev: bool
+) -> Tuple[Tuple[str, int], ...]:
+    """Get ucchaarana vector of a varna as (cached) tuple of pairs"""
+    vector = _ZERO_VECTOR[abbrev].copy()
+    for s in _LETTER_TO_CATEGORIES.get(varna, ()):
+        vector[s if abbrev else UCCHAARANA_NAMES[s]] = 1
+    return tuple(vector.items())
+
+
+def get_ucchaarana_vector_bits(letter: str) -> int:
+    """
+    Get ucchaarana sthaana and prayatna based vector of a letter as bitmask
 
-        def ucchaarana_name(s):
-            return UCCHAARANA_NAMES[s]
+    Compact alternative to `get_ucchaarana_vector`.
+    Bit `i` is set if the letter belongs to the `i`-th category of
+    `UCCHAARANA` (in key order).
 
-    vector = {ucchaarana_name(k): 0 for k in UCCHAARANA}
-    for s, varna_list in UCCHAARANA.items():
-        if varna in varna_list:
-            vector[ucchaarana_name(s)] = 1
+    Parameters
+    ----------
+    letter : str
+        Sanskrit letter
 
-    return vector
+    Returns
+    -------
+    int
+        Bitmask indicating utpatti sthaana, aabhyantara prayatna and
+        baahya prayatna of a letter
+    """
+    varna = _strip_halanta(letter)
+    return _LETTER_BITMASK.get(varna, 0)
 
 
 def get_ucchaarana_vectors(
@@ -921,14 +1163,9 @@ def get_ucchaarana_vectors(
     vectors : List[Tuple[str, Dict[str, int]]]
         List of (letter, vector)
     """
-    letters = []
-    for letter in split_varna_word(word, technical=False):
-        if [v for v in AYOGAVAAHA_COMMON if v in letter]:
-            letters.extend(letter)
-        else:
-            letters.append(letter)
     return [
-        (letter, get_ucchaarana_vector(letter, abbrev)) for letter in letters
+        (letter, get_ucchaarana_vector(letter, abbrev))
+        for letter in _iter_letters(word)
     ]
 
 
@@ -953,9 +1190,16 @@ def get_signature_letter(letter: str, abbrev: bool = False) -> Dict[str, str]:
     signature : Dict[str, str]
         utpatti sthaana, aabhyantara prayatna and baahya prayatna of a letter
     """
-    sthaana = get_ucchaarana_letter(letter, dimension=0, abbrev=abbrev)
-    aabhyantara = get_ucchaarana_letter(letter, dimension=1, abbrev=abbrev)
-    baahya = get_ucchaarana_letter(letter, dimension=2, abbrev=abbrev)
+    return _get_signature_letter(letter, _SIGNATURE_TABLE[bool(abbrev)])
+
+
+def _get_signature_letter(
+    letter: str, table: Dict[str, Tuple[str, str, str]]
+) -> Dict[str, str]:
+    """Get signature of a letter from a resolved (abbrev) signature table"""
+    sthaana, aabhyantara, baahya = table.get(
+        _strip_halanta(letter), _EMPTY_SIGNATURE
+    )
 
     signature = {
         "sthaana": sthaana,
@@ -988,14 +1232,16 @@ def get_signature_word(
         List of (letter, signature)
 
     """
-    letters = []
-    for letter in split_varna_word(word, technical=False):
-        if [v for v in AYOGAVAAHA_COMMON if v in letter]:
-            letters.extend(letter)
-        else:
-            letters.append(letter)
+    return _get_signature_word(word, _SIGNATURE_TABLE[bool(abbrev)])
+
+
+def _get_signature_word(
+    word: str, table: Dict[str, Tuple[str, str, str]]
+) -> List[Tuple[str, Dict[str, str]]]:
+    """Get signature of a word from a resolved (abbrev) signature table"""
     return [
-        (letter, get_signature_letter(letter, abbrev)) for letter in letters
+        (letter, _get_signature_letter(letter, table))
+        for letter in _iter_letters(word)
     ]
 
 
@@ -1020,21 +1266,17 @@ def get_signature(
         List of (letter, signature) for words in a nested list format
         Nesting Levels: Text -> Lines -> Words
     """
-    lines = split_lines(text.strip())
-    signature = []
-    for line in lines:
-        words = line.split()
-        line_signature = []
-        for word in words:
-            word_signature = get_signature_word(word, abbrev)
-            line_signature.append(word_signature)
-        signature.append(line_signature)
-    return signature
+    table = _SIGNATURE_TABLE[bool(abbrev)]
+    return [
+        [_get_signature_word(word, table) for word in words]
+        for words in _iter_lines_words(text)
+    ]
 
 
 ###############################################################################
 
 
+@lru_cache(maxsize=1024)
 def get_ucchaarana_letter(
     letter: str, dimension: int = 0, abbrev: bool = False
 ) -> str:
@@ -1064,32 +1306,8 @@ def get_ucchaarana_letter(
     str
         ucchaarana sthaana or prayatna of a letter
     """
-    varna = letter.replace(HALANTA, "") if letter.endswith(HALANTA) else letter
-    ucchaarana = []
-    _UCCHAARANA = [STHAANA, AABHYANTARA, BAAHYA]
-    _NAMES = [STHAANA_NAMES, AABHYANTARA_NAMES, BAAHYA_NAMES]
-
-    if abbrev:
-
-        def ucchaarana_name(s):
-            return s
-
-        join_str = "-"
-    else:
-
-        def ucchaarana_name(s):
-            return _NAMES[dimension][s]
-
-        join_str = " "
-
-    for s, varna_list in _UCCHAARANA[dimension].items():
-        if varna in varna_list:
-            ucchaarana.append(ucchaarana_name(s))
-
-    if len(ucchaarana) > 1 and not abbrev:
-        ucchaarana.append("च")
-
-    return join_str.join(ucchaarana)
+    varna = _strip_halanta(letter)
+    return _UCCHAARANA_TABLE[(dimension, bool(abbrev))].get(varna, "")
 
 
 def get_ucchaarana_word(
@@ -1125,16 +1343,19 @@ def get_ucchaarana_word(
         List of (letter, ucchaarana)
 
     """
-    letters = []
-    for letter in split_varna_word(word, technical=False):
-        if [v for v in AYOGAVAAHA_COMMON if v in letter]:
-            letters.extend(letter)
-        else:
-            letters.append(letter)
-    return [
-        (letter, get_ucchaarana_letter(letter, dimension, abbrev))
-        for letter in letters
-    ]
+    table = _UCCHAARANA_TABLE[(dimension, bool(abbrev))]
+    return _get_ucchaarana_word(word, table)
+
+
+def _get_ucchaarana_word(
+    word: str, table: Dict[str, str]
+) -> List[Tuple[str, str]]:
+    """Get ucchaarana of a word from a resolved (dimension, abbrev) table"""
+    ucchaarana = []
+    for letter in _iter_letters(word):
+        varna = _strip_halanta(letter)
+        ucchaarana.append((letter, table.get(varna, "")))
+    return ucchaarana
 
 
 def get_ucchaarana(
@@ -1167,16 +1388,11 @@ def get_ucchaarana(
         List of (letter, ucchaarana) for words in a nested list format
         Nesting Levels: Text -> Lines -> Words
     """
-    lines = split_lines(text.strip())
-    ucchaarana = []
-    for line in lines:
-        words = line.split()
-        line_ucchaarana = []
-        for word in words:
-            word_ucchaarana = get_ucchaarana_word(word, dimension, abbrev)
-            line_ucchaarana.append(word_ucchaarana)
-        ucchaarana.append(line_ucchaarana)
-    return ucchaarana
+    table = _UCCHAARANA_TABLE[(dimension, bool(abbrev))]
+    return [
+        [_get_ucchaarana_word(word, table) for word in words]
+        for words in _iter_lines_words(text)
+    ]
 
 
 ###############################################################################
@@ -1184,12 +1400,12 @@ def get_ucchaarana(
 
 def get_sthaana_letter(letter: str, abbrev: bool = False):
     """Wrapper for get_ucchaarana_letter for sthaana"""
-    return get_ucchaarana_letter(letter, dimension=0, abbrev=abbrev)
+    return get_ucchaarana_letter(letter, 0, abbrev)
 
 
 def get_sthaana_word(word: str, abbrev: bool = False):
     """Wrapper for get_ucchaarana_word for sthaana"""
-    return get_ucchaarana_word(word, dimension=0, abbrev=abbrev)
+    return get_ucchaarana_word(word, 0, abbrev)
 
 
 def get_sthaana(text: str, abbrev: bool = False):
@@ -1202,12 +1418,12 @@ def get_sthaana(text: str, abbrev: bool = False):
 
 def get_aabhyantara_letter(letter: str, abbrev: bool = False):
     """Wrapper for get_ucchaarana_letter for aabhyantara"""
-    return get_ucchaarana_letter(letter, dimension=1, abbrev=abbrev)
+    return get_ucchaarana_letter(letter, 1, abbrev)
 
 
 def get_aabhyantara_word(word: str, abbrev: bool = False):
     """Wrapper for get_ucchaarana_word for aabhyantara"""
-    return get_ucchaarana_word(word, dimension=1, abbrev=abbrev)
+    return get_ucchaarana_word(word, 1, abbrev)
 
 
 def get_aabhyantara(text: str, abbrev: bool = False):
@@ -1220,12 +1436,12 @@ def get_aabhyantara(text: str, abbrev: bool = False):
 
 def get_baahya_letter(letter: str, abbrev: bool = False):
     """Wrapper for get_ucchaarana_letter for baahya"""
-    return get_ucchaarana_letter(letter, dimension=2, abbrev=abbrev)
+    return get_ucchaarana_letter(letter, 2, abbrev)
 
 
 def get_baahya_word(word: str, abbrev: bool = False):
     """Wrapper for get_ucchaarana_word for baahya"""
-    return get_ucchaarana_word(word, dimension=2, abbrev=abbrev)
+    return get_ucchaarana_word(word, 2, abbrev)
 
 
 def get_baahya(text: str, abbrev: bool = False):
@@ -2,8 +2,149 @@
 
 """Tests for `sanskrit-text` package."""
 
+import sanskrit_text as skt
 
-def test_content(response):
-    """Sample pytest test function with the pytest fixture as an argument."""
-    # from bs4 import BeautifulSoup
-    # assert 'GitHub' in BeautifulSoup(response.content).title.string
+
+def test_form_pratyaahaara_without_valid_letters():
+    """No pratyaahaara can be formed without any valid letters"""
+    assert skt.form_pratyaahaara([]) is None
+    assert skt.form_pratyaahaara(["x"]) is None
+
+
+def test_extended_matra_to_swara():
+    """Extended matras map to (and from) the corresponding extended swaras"""
+    for matra, swara in zip(skt.EXTENDED_MATRA, skt.EXTENDED_SWARA):
+        assert skt.marker_to_swara(matra) == swara
+        assert skt.swara_to_marker(swara) == matra
+    assert skt.split_varna_word("कॆ", technical=False) == ["क्", "ऎ"]
+
+
+def test_ucchaarana_vector_bits():
+    """Bitmask agrees with the (abbreviated) ucchaarana vector"""
+    keys = list(skt.UCCHAARANA)
+    for letter in skt.ALPHABET + ["क्", ""]:
+        vector = skt.get_ucchaarana_vector(letter, abbrev=True)
+        bits = skt.get_ucchaarana_vector_bits(letter)
+        assert [vector[key] for key in keys] == [
+            (bits >> idx) & 1 for idx in range(len(keys))
+        ]
+
+
+def test_trim_matra_short_input():
+    """trim_matra handles empty and single-character input"""
+    assert skt.trim_matra("") == ""
+    assert skt.trim_matra(skt.ANUSWARA) == ""
+    assert skt.trim_matra("कीं") == "क"
+
+
+def test_split_lines_default():
+    """Default line splitting agrees with the separator regex"""
+    text = "क ख । ग॥घ\r\nङ ॥ । \n"
+    expected = ["क ख ", " ग", "घ", "ङ ", " ", " "]
+    assert skt.split_lines(text) == expected
+    assert skt.split_lines(text, skt._LINE_SPLIT_RE.pattern) == expected
+
+
+def test_get_syllables_word():
+    """Halanta-final segments merge into the following syllable"""
+    assert skt.get_syllables_word("कृष्णं") == ["कृ", "ष्णं"]
+    assert skt.get_syllables_word("संस्कृतम्") == ["सं", "स्कृ", "त", "म्"]
+
+
+def test_get_syllables_word_technical():
+    """Technical syllables keep conjunct consonants and ayogavaaha apart"""
+    assert skt.get_syllables_word("कृष्णं", technical=True) == [
+        "कृ",
+        "ष्",
+        "ण",
+        "ं",
+    ]
+    assert skt.get_syllables_word("संस्कृतम्", technical=True) == [
+        "स",
+        "ं",
+        "स्",
+        "कृ",
+        "त",
+        "म्",
+    ]
+
+
+def test_get_syllables_word_edges():
+    """Words ending in halanta or starting with a matra"""
+    for technical in [False, True]:
+        assert skt.get_syllables_word("वाक्", technical) == ["वा", "क्"]
+        assert skt.get_syllables_word("ािक", technical) == ["ाि", "क"]
+
+
+def test_get_syllables():
+    """Syllables of a text are nested as lines and words"""
+    assert skt.get_syllables("रामः वनं गच्छति । सीता च") == [
+        [["रा", "मः"], ["व", "नं"], ["ग", "च्छ", "ति"]],
+        [["सी", "ता"], ["च"]],
+    ]
+
+
+def test_split_varna_word():
+    """Technical and non-technical varna decomposition"""
+    assert skt.split_varna_word("कृष्णं") == [
+        "क्",
+        "ृ",
+        "ष्",
+        "ण्",
+        "-अ",
+        "ं",
+    ]
+    assert skt.split_varna_word("कृष्णं", technical=False) == [
+        "क्",
+        "ऋ",
+        "ष्",
+        "ण्",
+        "अं",
+    ]
+
+
+def test_split_varna_join_varna():
+    """Joining the (flat, technical) varna decomposition restores the text"""
+    text = "रामः वनं गच्छति\nसंस्कृतम्"
+    assert skt.join_varna(skt.split_varna(text, flat=True)) == text
+
+
+def test_form_pratyaahaara():
+    """Letters of a pratyaahaara form the same pratyaahaara, in any order"""
+    for pratyaahaara in ["अच्", "इक्", "यण्", "झष्", "अल्"]:
+        letters = skt.resolve_pratyaahaara(pratyaahaara)[0]
+        assert skt.form_pratyaahaara(letters) == pratyaahaara
+        assert skt.form_pratyaahaara(letters[::-1]) == pratyaahaara
+        shuffled = letters[1::2] + letters[::2]
+        assert skt.form_pratyaahaara(shuffled) == pratyaahaara
+
+
+def test_form_pratyaahaara_with_ha():
+    """'ह' appears twice in the Maaheshwara Sutras"""
+    for pratyaahaara in ["हश्", "शल्", "हल्"]:
+        letters = skt.resolve_pratyaahaara(pratyaahaara)[0]
+        assert skt.form_pratyaahaara(letters) == pratyaahaara
+        assert skt.form_pratyaahaara(letters[::-1]) == pratyaahaara
+
+
+def test_form_pratyaahaara_invalid():
+    """Discontinuous letters or a wrong end position give no pratyaahaara"""
+    assert skt.form_pratyaahaara(["अ", "ऋ"]) is None
+    assert skt.form_pratyaahaara(["अ", "इ"]) is None
+
+
+def test_fix_anuswara():
+    """Anuswara before a vargiya consonant becomes its anunaasika"""
+    assert skt.fix_anuswara("संकल्प") == "सङ्कल्प"
+    assert skt.fix_anuswara("संगम") == "सङ्गम"
+    assert skt.fix_anuswara("पंच") == "पञ्च"
+    assert skt.fix_anuswara("कंठ") == "कण्ठ"
+    assert skt.fix_anuswara("संत") == "सन्त"
+    assert skt.fix_anuswara("संपूर्ण") == "सम्पूर्ण"
+    assert skt.fix_anuswara("संगम संत") == "सङ्गम सन्त"
+
+
+def test_fix_anuswara_unchanged():
+    """Anuswara elsewhere is left as it is"""
+    for text in ["संयम", "संसार", "संहार", "रामं", skt.ANUSWARA, ""]:
+        assert skt.fix_anuswara(text) == text